@@ -150,6 +150,7 @@ class MILBot(commands.Bot):
         self.tasks = TaskManager(self)
         self._setup = asyncio.Event()
         self.verifier = Verifier()
+        self.github = GitHub(auth_token=GITHUB_TOKEN, bot=self)
 
     async def on_ready(self):
         print("Logged on as", self.user)
@@ -513,7 +514,6 @@ class MILBot(commands.Bot):
             task.bot = self
             task.schedule()
 
-        self.github = GitHub(auth_token=GITHUB_TOKEN, bot=bot)
         self._setup.set()
 
     def team_leads_ch(self, team: Team) -> discord.TextChannel:
@@ -624,7 +624,20 @@ async def main():
     logger = logging.getLogger()
     logger.addHandler(RichHandler(rich_tracebacks=True))
 
-    async with bot, aiohttp.ClientSession() as session:
+    # Keep connections (especially to api.github.com) alive between requests
+    # and avoid re-resolving DNS for every request
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+    )
+    async with bot, aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": "uf-mil/discord-bot"},
+        timeout=aiohttp.ClientTimeout(total=30),
+    ) as session:
         bot.session = session
         await bot.start(token=DISCORD_TOKEN)
 
@@ -54,3 +54,11 @@ WEBHOOK_SERVER_PORT = ensure_string("WEBHOOK_SERVER_PORT", True)
 GITHUB_OAUTH_CLIENT_ID = ensure_string("GITHUB_OAUTH_CLIENT_ID", True)
 GITHUB_OAUTH_CLIENT_SECRET = ensure_string("GITHUB_OAUTH_CLIENT_SECRET", True)
 IPC_PORT = ensure_string("IPC_PORT", True)
+
+# Comma-separated channel IDs where commit/issue references are expanded. If
+# unset, references are expanded in every channel.
+GITHUB_LINK_CHANNEL_IDS = {
+    int(channel_id)
+    for channel_id in ensure_string("GITHUB_LINK_CHANNEL_IDS", True).split(",")
+    if channel_id.strip()
+}
@@ -1,31 +1,75 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
 import re
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import aiohttp
 import discord
 from discord.ext import commands
 
-from ..env import GITHUB_TOKEN
-from .github import GitHub
+from ..env import GITHUB_LINK_CHANNEL_IDS
+from ..utils import capped_str
 from .types import (
     Issue,
+    Repository,
 )
 
 if TYPE_CHECKING:
     from ..bot import MILBot
 
+# Matches commit hashes. Hashes must be at least 7 characters long (git's
+# default abbreviated length) and contain a digit, which filters out
+# hex-looking words (ex, "decade", "facade")
+HASH_REGEX = re.compile(r"\b(?=[0-9a-f]*[0-9])[0-9a-f]{7,40}(?!>)\b", re.IGNORECASE)
+# Matches issue/pull request references: ##123 for the main repository, and
+# s8#123/s9#123 for the electrical SubjuGator repositories
+ISSUE_REFERENCE_REGEX = re.compile(
+    r"\#\#(?P<mil>\d+)\b|\bs8\#(?P<s8>\d+)\b|\bs9\#(?P<s9>\d+)\b",
+    re.IGNORECASE,
+)
+ISSUE_REFERENCE_REPOS = {
+    "mil": "uf-mil/mil",
+    "s8": "uf-mil-electrical/SubjuGator8",
+    "s9": "uf-mil-electrical/SubjuGator9",
+}
+CHECK_PASSED = "✅"
+CHECK_FAILED = "❌"
+
+
+@dataclass
+class RepoMeta:
+    """
+    The parts of a repository that are shown in commit embeds.
+    """
+
+    full_name: str
+    html_url: str
+    avatar_url: str
+    field_value: str
+
+    @classmethod
+    def from_repository(cls, repository: Repository) -> RepoMeta:
+        return cls(
+            full_name=repository["full_name"],
+            html_url=repository["html_url"],
+            avatar_url=repository["owner"]["avatar_url"],
+            field_value=f"[`{repository['full_name']}`]({repository['html_url']})",
+        )
+
 
 class GitHubCog(commands.Cog):
+
+    _repo_meta: dict[str, RepoMeta]
+
     def __init__(self, bot: MILBot):
         self.bot = bot
-        self.github = GitHub(
-            auth_token=GITHUB_TOKEN,
-            bot=bot,
-        )
+        # Share the bot's client so that all GitHub calls go through one session
+        self.github = bot.github
+        self._repo_meta = {}
 
     async def get_commit(self, commit_hash: str) -> discord.Embed | None:
         logging.info(f"Getting commit info for hash {commit_hash}...")
@@ -40,18 +84,15 @@ class GitHubCog(commands.Cog):
         commits = commits["items"]
         if commits:
             commit = commits[0]
-            org_name = commit["repository"]["owner"]["login"]
-            repo_name = commit["repository"]["name"]
-            branches_response = await self.github.get_branches_for_commit(
-                f"{org_name}/{repo_name}",
-                commit_hash,
-            )
-            branches = [branch["name"] for branch in branches_response]
-
-            # URL to get status and checks for the commit
-            checks_response = await self.github.get_checks(
-                f"{org_name}/{repo_name}",
-                commit_hash,
+            full_name = commit["repository"]["full_name"]
+            meta = self._repo_meta.get(full_name)
+            if not meta:
+                meta = RepoMeta.from_repository(commit["repository"])
+                self._repo_meta[full_name] = meta
+            # Branches (REST) and checks (GraphQL) are fetched concurrently
+            details = await self.github.get_commit_details(
+                meta.full_name,
+                commit["sha"],
             )
 
             embed = discord.Embed(
@@ -59,7 +100,7 @@ class GitHubCog(commands.Cog):
                 color=discord.Color.green(),
                 url=commit["html_url"],
             )
-            embed.set_thumbnail(url=commit["repository"]["owner"]["avatar_url"])
+            embed.set_thumbnail(url=meta.avatar_url)
             if commit["author"]:
                 embed.set_author(
                     name=commit["author"]["login"],
@@ -68,7 +109,7 @@ class GitHubCog(commands.Cog):
                 )
             embed.add_field(
                 name="Repository",
-                value=f"[`{commit['repository']['full_name']}`]({commit['repository']['html_url']})",
+                value=meta.field_value,
                 inline=True,
             )
             iso_date = datetime.datetime.fromisoformat(
@@ -84,20 +125,22 @@ class GitHubCog(commands.Cog):
                 value=commit["commit"]["message"][:1024],
                 inline=False,
             )
+            branches = [
+                f"[`{branch}`]({meta.html_url}/tree/{branch})"
+                for branch in details.branches
+            ]
             embed.add_field(
                 name="Branches",
-                value=", ".join(
-                    f"[`{branch}`]({commit['repository']['html_url']}/tree/{branch})"
-                    for branch in branches
-                ),
+                value=capped_str(branches, separator=", "),
                 inline=False,
             )
+            checks = [
+                f"{CHECK_PASSED if check['conclusion'] else CHECK_FAILED} [{check['name']}]({check['permalink']})"
+                for check in details.check_runs
+            ]
             embed.add_field(
                 name="Checks",
-                value="\n".join(
-                    f"{'✅' if check['conclusion'] else '❌'} [{check['name']}]({check['html_url']})"
-                    for check in checks_response["check_runs"]
-                ),
+                value=capped_str(checks),
                 inline=False,
             )
             return embed
@@ -118,8 +161,8 @@ class GitHubCog(commands.Cog):
                 icon_url=issue["user"]["avatar_url"],
             )
             res.set_thumbnail(url=issue["user"]["avatar_url"])
-        url_segments = issue["repository_url"].split("/")
-        repository_name = f"{url_segments[-2]}/{url_segments[-1]}"
+        _, owner, name = issue["repository_url"].rsplit("/", 2)
+        repository_name = f"{owner}/{name}"
         res.add_field(
             name="Repository",
             value=f"[`{repository_name}`]({issue['repository_url']})",
@@ -137,17 +180,19 @@ class GitHubCog(commands.Cog):
             value=issue["state"],
             inline=True,
         )
+        labels = [f"`{label['name']}`" for label in issue["labels"]]
         res.add_field(
             name="Labels",
-            value=", ".join(f"`{label['name']}`" for label in issue["labels"]),
+            value=capped_str(labels, separator=", "),
             inline=True,
         )
+        assignees = [
+            f"[`{assignee['login']}`]({assignee['html_url']})"
+            for assignee in issue["assignees"]
+        ]
         res.add_field(
             name="Assignees",
-            value=", ".join(
-                f"[`{assignee['login']}`]({assignee['html_url']})"
-                for assignee in issue["assignees"]
-            ),
+            value=capped_str(assignees, separator=", "),
             inline=True,
         )
         res.add_field(
@@ -163,65 +208,60 @@ class GitHubCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
-        # Ignore own messages
-        if message.author == self.bot.user:
+        # Ignore bots (including ourselves), DMs, and channels where references
+        # should not be expanded
+        if message.author.bot or message.guild is None:
+            return
+        if (
+            GITHUB_LINK_CHANNEL_IDS
+            and message.channel.id not in GITHUB_LINK_CHANNEL_IDS
+        ):
             return
 
-        hashes = re.findall(
-            r"\b[0-9a-f]{5,40}(?!>)\b",
-            message.content,
-            re.IGNORECASE | re.MULTILINE,
-        )
+        # Every issue reference needs a number, and commit hashes are expected to
+        # contain a digit, so most messages can be skipped without any regex
+        content = message.content
+        if not any(c.isdigit() for c in content):
+            return
+
+        # Duplicates are dropped while preserving the order they were mentioned in
+        hashes = list(dict.fromkeys(HASH_REGEX.findall(content)))
+        embeds: list[discord.Embed] = []
         if hashes:
-            embeds = [await self.get_commit(commit_hash) for commit_hash in hashes]
-            if any(not e for e in embeds):
-                pass
-            else:
-                await message.reply(
-                    embeds=[e for e in embeds if isinstance(e, discord.Embed)],
-                )
+            commit_embeds = await asyncio.gather(
+                *(self.get_commit(commit_hash) for commit_hash in hashes),
+                return_exceptions=True,
+            )
+            for e in commit_embeds:
+                if isinstance(e, BaseException):
+                    logging.error("Failed to get commit info", exc_info=e)
+            # Unknown hashes should not prevent recognized commits from being shown
+            embeds.extend(e for e in commit_embeds if isinstance(e, discord.Embed))
 
-        # If a term is found starting with two hashtags followed by a number,
-        # assume that this is referencing an issue or pull request in the main
-        # repository. If this is found, send embeds for each issue or pull.
-        DOUBLE_HASH_REGEX = r"\#\#(\d+)\b"
-        matches = re.findall(
-            DOUBLE_HASH_REGEX,
-            message.content,
-            re.IGNORECASE | re.MULTILINE,
-        )
-        if matches:
-            for match in matches:
-                issue = await self.github.get_issue("uf-mil/mil", int(match))
-                await message.reply(embed=self.get_issue_or_pull(issue))
-
-        ELECTRICAL_SUB8_REGEX = r"\bs8\#(\d+)\b"
-        matches = re.findall(
-            ELECTRICAL_SUB8_REGEX,
-            message.content,
-            re.IGNORECASE | re.MULTILINE,
-        )
-        if matches:
-            for match in matches:
-                issue = await self.github.get_issue(
-                    "uf-mil-electrical/SubjuGator8",
-                    int(match),
-                )
-                await message.reply(embed=self.get_issue_or_pull(issue))
+        if "#" in content:
+            embeds.extend(await self.get_issue_embeds(content))
 
-        ELECTRICAL_SUB9_REGEX = r"\bs9\#(\d+)\b"
-        matches = re.findall(
-            ELECTRICAL_SUB9_REGEX,
-            message.content,
-            re.IGNORECASE | re.MULTILINE,
+        # Discord allows at most 10 embeds per message
+        for i in range(0, len(embeds), 10):
+            await message.reply(embeds=embeds[i : i + 10])
+
+    async def get_issue_embeds(self, content: str) -> list[discord.Embed]:
+        # Group the referenced issue numbers by repository, without duplicates
+        references: dict[str, dict[int, None]] = {}
+        for match in ISSUE_REFERENCE_REGEX.finditer(content):
+            group = match.lastgroup
+            assert group is not None
+            repo_name = ISSUE_REFERENCE_REPOS[group]
+            references.setdefault(repo_name, {})[int(match[group])] = None
+        if not references:
+            return []
+
+        # Look up all referenced issues, across all repositories, in one query;
+        # references to issues that don't exist are skipped
+        issues = await self.github.get_issues(
+            {repo_name: list(numbers) for repo_name, numbers in references.items()},
         )
-        if matches:
-            for match in matches:
-                issue = await self.github.get_issue(
-                    "uf-mil-electrical/SubjuGator9",
-                    int(match),
-                )
-                await message.reply(embed=self.get_issue_or_pull(issue))
+        return [self.get_issue_or_pull(issue) for issue in issues]
 
 
 async def setup(bot: MILBot):
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
-import json
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal
 
+import aiohttp
+import orjson
+
 from ..env import GITHUB_OAUTH_CLIENT_ID
 from .types import (
-    Branch,
-    CheckRunsData,
     CommitSearchResults,
     Invitation,
     Issue,
@@ -25,6 +29,293 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Cache lifetimes (in seconds)
+SHORT_CACHE_TTL = 300  # commits, issues, repos
+LONG_CACHE_TTL = 3600  # users, teams
+NOT_FOUND_CACHE_TTL = 60
+CACHE_MAX_SIZE = 512
+
+# Client-side rate limiting
+MAX_CONCURRENT_REQUESTS = 10
+RATE_LIMIT_ATTEMPTS = 2
+# Start spacing out requests once less than this fraction of a rate limit
+# resource's (core, search, graphql, ...) budget remains
+RATE_LIMIT_THROTTLE_FRACTION = 0.1
+RATE_LIMIT_MAX_DELAY = 60
+# Transient server errors are retried for idempotent (GET) requests, waiting
+# SERVER_ERROR_BACKOFF, then twice as long, and so on between attempts
+SERVER_ERROR_STATUSES = (502, 503, 504)
+SERVER_ERROR_ATTEMPTS = 3
+SERVER_ERROR_BACKOFF = 1
+
+# Fields of project items used to build SoftwareProjectItem
+PROJECT_ITEMS_FRAGMENT = """
+    fragment ProjectItems on ProjectV2ItemConnection {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        content {
+          ... on Issue {
+            title
+            number
+          }
+        }
+        fieldValues(first: 10) {
+          nodes {
+            ... on ProjectV2ItemFieldDateValue {
+              date
+              field {
+                ... on ProjectV2Field {
+                  name
+                }
+              }
+            }
+            ... on ProjectV2ItemFieldSingleSelectValue {
+              name
+              field {
+                ... on ProjectV2SingleSelectField {
+                  name
+                }
+              }
+            }
+            ... on ProjectV2ItemFieldUserValue {
+              users(first: 4) {
+                nodes {
+                  login
+                  name
+                }
+              }
+              field {
+                ... on ProjectV2Field {
+                  name
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+
+# Check runs of a single commit
+COMMIT_DETAILS_QUERY = """
+    query ($owner: String!, $name: String!, $oid: GitObjectID!) {
+      repository(owner: $owner, name: $name) {
+        object(oid: $oid) {
+          ... on Commit {
+            checkSuites(first: 10) {
+              nodes {
+                checkRuns(first: 20) {
+                  nodes {
+                    name
+                    conclusion
+                    permalink
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+
+# Commits by an author on every branch of the recently pushed repositories
+BRANCH_COMMITS_QUERY = """
+    query ($organization: String!, $since: GitTimestamp!, $authorId: ID!) {
+      organization(login: $organization) {
+        repositories(first: 10, orderBy: {field: PUSHED_AT, direction: DESC}) {
+          nodes {
+            refs(first: 30, refPrefix: "refs/heads/") {
+              nodes {
+                ... on Ref {
+                  name
+                  target {
+                    ... on Commit {
+                      history(first: 10, since: $since, author: {id: $authorId}) {
+                        nodes {
+                          ... on Commit {
+                            author {
+                              date
+                              email
+                              user {
+                                login
+                              }
+                            }
+                            oid
+                            message
+                            repository {
+                              nameWithOwner
+                            }
+                          }
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+
+# Open uf-mil projects, with the first page of their items
+SOFTWARE_PROJECTS_QUERY = (
+    """
+    query ($cursor: String) {
+      viewer {
+        organization(login: "uf-mil") {
+          projectsV2(first: 20, after: $cursor, query: "is:open") {
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
+            nodes {
+              id
+              title
+              number
+              shortDescription
+              items(first: 50) {
+                ...ProjectItems
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+    + PROJECT_ITEMS_FRAGMENT
+)
+
+# The items of a single project after a cursor
+PROJECT_ITEMS_QUERY = (
+    """
+    query ($id: ID!, $cursor: String) {
+      node(id: $id) {
+        ... on ProjectV2 {
+          items(first: 100, after: $cursor) {
+            ...ProjectItems
+          }
+        }
+      }
+    }
+"""
+    + PROJECT_ITEMS_FRAGMENT
+)
+
+# Pull requests, issue comments and issues of the viewer
+USER_CONTRIBUTIONS_QUERY = """
+    query ($since: DateTime, $pullRequestsQuery: String!) {
+      pullRequests: search(query: $pullRequestsQuery, type: ISSUE, first: 100) {
+        nodes {
+          ... on PullRequest {
+            title
+            number
+            createdAt
+            repository {
+              nameWithOwner
+              name
+              owner {
+                login
+              }
+            }
+          }
+        }
+      }
+      rateLimit {
+        remaining
+        limit
+        used
+        cost
+      }
+      viewer {
+        issueComments(first: 100, orderBy: {field: UPDATED_AT, direction: DESC}) {
+          nodes {
+            bodyText
+            createdAt
+            issue {
+              title
+              number
+            }
+            repository {
+              nameWithOwner
+              name
+              owner {
+                login
+              }
+            }
+          }
+        }
+        issues(first: 100, filterBy: {since: $since}) {
+          nodes {
+            title
+            createdAt
+            number
+            author {
+              login
+            }
+            repository {
+              nameWithOwner
+              name
+              owner {
+                login
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+
+# Format of GraphQL DateTime values
+GRAPHQL_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# (method, url, token, extra headers, JSON body)
+CacheKey = tuple[str, str, str, tuple[tuple[str, str], ...], bytes | None]
+
+
+def _created_between(
+    nodes: Iterable[dict[str, Any]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> list[dict[str, Any]]:
+    """
+    Returns the GraphQL nodes created between start and end, newest first.
+
+    GraphQL timestamps are always in UTC and formatted the same way (ex,
+    2024-01-01T12:00:00Z), so they sort correctly as strings and are compared
+    without being parsed.
+    """
+    start_timestamp = start.astimezone(datetime.timezone.utc).strftime(
+        GRAPHQL_TIMESTAMP_FORMAT,
+    )
+    end_timestamp = end.astimezone(datetime.timezone.utc).strftime(
+        GRAPHQL_TIMESTAMP_FORMAT,
+    )
+    filtered = [
+        node for node in nodes if start_timestamp < node["createdAt"] < end_timestamp
+    ]
+    filtered.sort(key=lambda node: node["createdAt"], reverse=True)
+    return filtered
+
+
+@dataclass
+class CacheEntry:
+    expires_at: float
+    value: Any
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class CommitDetails:
+    branches: list[str]
+    check_runs: list[dict[str, Any]]
+
 
 @dataclass
 class UserContributions:
@@ -35,9 +326,24 @@ class UserContributions:
 
 
 class GitHub:
+    _cache: OrderedDict[CacheKey, CacheEntry]
+    _developers_team_id: int | None
+    _semaphore: asyncio.Semaphore
+    # Access token -> viewer login and node ID
+    _viewers: dict[str, dict[str, str]]
+    _in_flight: dict[CacheKey, asyncio.Future[Any]]
+    # Rate limit resource -> time.monotonic() before which no request to it is sent
+    _not_before: dict[str, float]
+
     def __init__(self, *, auth_token: str, bot: MILBot):
         self.auth_token = auth_token
         self.bot = bot
+        self._cache = OrderedDict()
+        self._developers_team_id = None
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._viewers = {}
+        self._in_flight = {}
+        self._not_before = {}
 
     async def fetch(
         self,
@@ -45,31 +351,254 @@ class GitHub:
         *,
         method: Literal["GET", "POST"] = "GET",
         extra_headers: dict[str, str] | None = None,
-        data: dict[str, Any] | str | None = None,
+        data: dict[str, Any] | str | bytes | None = None,
+        payload: dict[str, Any] | None = None,
         user_access_token: str | None = None,
+        cache_ttl: float | None = None,
     ):
         """
         Fetches a URL with the given method and headers.
 
+        data is sent as-is (ex, form data), while payload is serialized as a
+        JSON body.
+
+        If cache_ttl is provided, the response is cached for that many seconds.
+        For POST requests (ex, GraphQL queries), the JSON payload is part of the
+        cache key. 404 responses are cached for a shorter amount of time.
+        Once a cached response expires, it is revalidated with a conditional
+        request; a 304 Not Modified response reuses the cached body. Concurrent
+        identical cacheable requests only reach GitHub once.
+
         Raises ClientResponseError if the response status is not 2xx.
         """
+        token = user_access_token or self.auth_token
+        body = orjson.dumps(payload) if payload is not None else None
+        cache_key = (
+            method,
+            url,
+            token,
+            tuple(sorted(extra_headers.items())) if extra_headers else (),
+            body,
+        )
+        use_cache = cache_ttl is not None
+        entry = self._cache.get(cache_key) if use_cache else None
+        if entry and time.monotonic() < entry.expires_at:
+            self._cache.move_to_end(cache_key)
+            if isinstance(entry.value, aiohttp.ClientResponseError):
+                raise entry.value
+            return entry.value
+        if not use_cache:
+            return await self._request(
+                cache_key,
+                entry,
+                method=method,
+                url=url,
+                token=token,
+                extra_headers=extra_headers,
+                data=data,
+                body=body,
+                cache_ttl=cache_ttl,
+            )
+
+        # Identical requests made while this one is in flight share its response
+        # rather than racing to the network
+        task = self._in_flight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._request(
+                    cache_key,
+                    entry,
+                    method=method,
+                    url=url,
+                    token=token,
+                    extra_headers=extra_headers,
+                    data=data,
+                    body=body,
+                    cache_ttl=cache_ttl,
+                ),
+            )
+            self._in_flight[cache_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(cache_key, None))
+        # Cancelling one caller should not cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _request(
+        self,
+        cache_key: CacheKey,
+        entry: CacheEntry | None,
+        *,
+        method: Literal["GET", "POST"],
+        url: str,
+        token: str,
+        extra_headers: dict[str, str] | None,
+        data: dict[str, Any] | str | bytes | None,
+        body: bytes | None,
+        cache_ttl: float | None,
+    ):
+        """
+        Sends a request that could not be answered from the cache, and caches
+        the response if cache_ttl is provided.
+        """
+        use_cache = cache_ttl is not None
         headers = {
-            "Authorization": f"Bearer {user_access_token or self.auth_token}",
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
         }
         if extra_headers:
             headers.update(extra_headers)
-        async with self.bot.session.request(
-            method,
-            url,
-            headers=headers,
-            data=data,
-        ) as response:
-            if not response.ok:
-                logger.error(
-                    f"Error fetching GitHub url {url}: {await response.json()}",
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+            data = body
+        # Revalidate stale entries rather than downloading them again
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        resource = self._rate_limit_resource(url)
+        try:
+            for attempt in range(max(RATE_LIMIT_ATTEMPTS, SERVER_ERROR_ATTEMPTS)):
+                # Space out requests when the rate limit is running low, or wait
+                # out a rate limit that was hit
+                while (
+                    delay := self._not_before.get(resource, 0) - time.monotonic()
+                ) > 0:
+                    await asyncio.sleep(delay)
+                # Bound the number of concurrent requests so that bursts (ex, a
+                # message with many hashes) don't trip secondary rate limits
+                async with self._semaphore, self.bot.session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=data,
+                ) as response:
+                    retry_after = self._retry_after(method, response, attempt)
+                    if retry_after is None:
+                        self._throttle(resource, response)
+                        if entry and cache_ttl is not None and response.status == 304:
+                            entry.expires_at = time.monotonic() + cache_ttl
+                            self._cache.move_to_end(cache_key)
+                            return entry.value
+                        if not response.ok:
+                            # 404s are expected (ex, looking up a username that
+                            # does not exist), so don't spend time decoding
+                            # their bodies
+                            if response.status == 404:
+                                logger.debug(f"GitHub {method} {url} -> 404")
+                            else:
+                                error_text = await response.text()
+                                logger.error(
+                                    f"GitHub {method} {url} -> {response.status}: {error_text[:512]}",
+                                )
+                        response.raise_for_status()
+                        # Some endpoints (ex, 204 No Content) have no body
+                        raw = await response.read()
+                        result = orjson.loads(raw) if raw else None
+                        etag = response.headers.get("ETag")
+                        last_modified = response.headers.get("Last-Modified")
+                if retry_after is None:
+                    break
+                logger.warning(
+                    f"Waiting {retry_after:.1f}s before retrying GitHub {method} {url} ({response.status}).",
+                )
+                if response.status in (403, 429):
+                    # Hold back every request to the rate limited resource, not
+                    # just this one; the wait happens at the top of the loop
+                    self._hold_back(resource, retry_after)
+                else:
+                    await asyncio.sleep(retry_after)
+        except aiohttp.ClientResponseError as e:
+            if use_cache and e.status == 404:
+                self._store_cache(
+                    cache_key,
+                    CacheEntry(time.monotonic() + NOT_FOUND_CACHE_TTL, e),
                 )
-            response.raise_for_status()
-            return await response.json()
+            raise
+
+        if use_cache:
+            assert cache_ttl is not None
+            self._store_cache(
+                cache_key,
+                CacheEntry(time.monotonic() + cache_ttl, result, etag, last_modified),
+            )
+        return result
+
+    def _retry_after(
+        self,
+        method: str,
+        response: aiohttp.ClientResponse,
+        attempt: int,
+    ) -> float | None:
+        """
+        Returns how long to wait before retrying a rate limited (or temporarily
+        unavailable) request, or None if the request should not be retried.
+
+        Secondary rate limits send a Retry-After header, while the primary rate
+        limit only reports when it resets. Waits longer than
+        RATE_LIMIT_MAX_DELAY are not retried.
+        """
+        if response.status in SERVER_ERROR_STATUSES:
+            if method != "GET" or attempt >= SERVER_ERROR_ATTEMPTS - 1:
+                return None
+            return SERVER_ERROR_BACKOFF * 2**attempt
+        if response.status not in (403, 429) or attempt >= RATE_LIMIT_ATTEMPTS - 1:
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        reset = response.headers.get("X-RateLimit-Reset")
+        if response.headers.get("X-RateLimit-Remaining") == "0" and reset:
+            delay = max(int(reset) - time.time(), 0)
+            if delay <= RATE_LIMIT_MAX_DELAY:
+                return delay
+        return None
+
+    @staticmethod
+    def _rate_limit_resource(url: str) -> str:
+        """
+        Returns the rate limit resource (as in X-RateLimit-Resource) that a
+        request to the URL counts against.
+        """
+        if url.startswith("https://api.github.com/search/"):
+            return "search"
+        if url == "https://api.github.com/graphql":
+            return "graphql"
+        return "core"
+
+    def _throttle(self, resource: str, response: aiohttp.ClientResponse) -> None:
+        """
+        Delays later requests to the response's rate limit resource so that its
+        remaining budget is spread out until it resets. The response itself is
+        not delayed.
+        """
+        limit = response.headers.get("X-RateLimit-Limit")
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if limit is None or remaining is None or reset is None:
+            return
+        if int(remaining) >= int(limit) * RATE_LIMIT_THROTTLE_FRACTION:
+            return
+        delay = (int(reset) - time.time()) / max(int(remaining), 1)
+        delay = min(max(delay, 0), RATE_LIMIT_MAX_DELAY)
+        logger.warning(
+            f"GitHub {resource} rate limit is low ({remaining}/{limit} left), spacing requests by {delay:.1f}s.",
+        )
+        self._hold_back(resource, delay)
+
+    def _hold_back(self, resource: str, delay: float) -> None:
+        """
+        Keeps requests to the rate limit resource from being sent for the next
+        delay seconds. An existing, longer wait is kept.
+        """
+        self._not_before[resource] = max(
+            self._not_before.get(resource, 0),
+            time.monotonic() + delay,
+        )
+
+    def _store_cache(self, key: CacheKey, entry: CacheEntry) -> None:
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
 
     async def get_oauth_device_code(self) -> dict[str, Any]:
         url = "https://github.com/login/device/code"
@@ -108,37 +637,202 @@ class GitHub:
 
     async def get_repo(self, repo_name: str) -> Repository:
         url = f"https://api.github.com/repos/{repo_name}"
-        return await self.fetch(url)
+        return await self.fetch(url, cache_ttl=SHORT_CACHE_TTL)
 
     async def get_issue(self, repo_name: str, issue_number: int) -> Issue:
         url = f"https://api.github.com/repos/{repo_name}/issues/{issue_number}"
-        return await self.fetch(url)
+        return await self.fetch(url, cache_ttl=SHORT_CACHE_TTL)
+
+    async def get_issues(self, references: dict[str, list[int]]) -> list[Issue]:
+        """
+        Returns several issues or pull requests, possibly spread across several
+        repositories, using a single GraphQL query. Issues which could not be
+        found are skipped.
+
+        The returned dictionaries only contain the subset of the REST issue
+        fields that are needed to display an issue.
+
+        Args:
+            references: A mapping of repository names (``owner/name``) to the
+                issue numbers to fetch from that repository.
+        """
+        if not references:
+            return []
+        fields = """
+          number
+          title
+          url
+          state
+          createdAt
+          author {
+            login
+            url
+            avatarUrl
+          }
+          labels(first: 10) {
+            nodes {
+              name
+            }
+          }
+          assignees(first: 10) {
+            nodes {
+              login
+              url
+            }
+          }
+          milestone {
+            title
+            url
+          }
+        """
+        # Each repository gets its own alias (r0, r1, ...), and each issue its
+        # own alias inside of that repository
+        parameters = []
+        repositories = []
+        variables = {}
+        for index, (repo_name, issue_numbers) in enumerate(references.items()):
+            owner, name = repo_name.split("/", 1)
+            parameters.append(f"$owner{index}: String!, $name{index}: String!")
+            variables[f"owner{index}"] = owner
+            variables[f"name{index}"] = name
+            aliases = "".join(
+                f"""
+                i{number}: issueOrPullRequest(number: {number}) {{
+                  ... on Issue {{ {fields} }}
+                  ... on PullRequest {{ {fields} }}
+                }}"""
+                for number in issue_numbers
+            )
+            repositories.append(
+                f"""
+                r{index}: repository(owner: $owner{index}, name: $name{index}) {{
+                  {aliases}
+                }}""",
+            )
+        query = f"""
+        query ({", ".join(parameters)}) {{
+          {"".join(repositories)}
+        }}
+        """
+        properties = await self.fetch(
+            "https://api.github.com/graphql",
+            method="POST",
+            payload={"query": query, "variables": variables},
+            cache_ttl=SHORT_CACHE_TTL,
+        )
+        # Missing issues are reported as errors alongside the issues that were
+        # found, so errors only matter if nothing was returned at all
+        data = properties.get("data")
+        if not data:
+            logger.error(f"GitHub issues query failed: {properties.get('errors')}")
+            return []
+        if properties.get("errors"):
+            logger.debug(f"GitHub issues query errors: {properties['errors']}")
+        issues = []
+        for index, (repo_name, issue_numbers) in enumerate(references.items()):
+            repository = data.get(f"r{index}") or {}
+            for number in issue_numbers:
+                node = repository.get(f"i{number}")
+                if not node:
+                    continue
+                author = node["author"]
+                issues.append(
+                    {
+                        "number": node["number"],
+                        "title": node["title"],
+                        "html_url": node["url"],
+                        # REST only reports merged pull requests as closed
+                        "state": (
+                            "closed"
+                            if node["state"] == "MERGED"
+                            else node["state"].lower()
+                        ),
+                        "created_at": node["createdAt"],
+                        "repository_url": f"https://api.github.com/repos/{repo_name}",
+                        "user": (
+                            {
+                                "login": author["login"],
+                                "html_url": author["url"],
+                                "avatar_url": author["avatarUrl"],
+                            }
+                            if author
+                            else None
+                        ),
+                        "labels": node["labels"]["nodes"],
+                        "assignees": [
+                            {"login": assignee["login"], "html_url": assignee["url"]}
+                            for assignee in node["assignees"]["nodes"]
+                        ],
+                        "milestone": (
+                            {
+                                "title": node["milestone"]["title"],
+                                "html_url": node["milestone"]["url"],
+                            }
+                            if node["milestone"]
+                            else None
+                        ),
+                    },
+                )
+        return issues  # type: ignore
 
-    async def get_branches_for_commit(self, repo_name: str, hash: str) -> list[Branch]:
-        url = f"https://api.github.com/repos/{repo_name}/commits/{hash}/branches-where-head"
-        return await self.fetch(url)
+    async def get_commit_details(self, repo_name: str, hash: str) -> CommitDetails:
+        """
+        Returns the branches pointing at a commit and the check runs for the
+        commit. The branches and the check runs are requested concurrently.
+
+        Args:
+            repo_name(str): Example: uf-mil/mil
+            hash(str): The full object ID of the commit.
+        """
+        owner, name = repo_name.split("/", 1)
+        branches, properties = await asyncio.gather(
+            # GraphQL can only list branches a page at a time, while this
+            # returns exactly the branches whose head is the commit
+            self.fetch(
+                f"https://api.github.com/repos/{repo_name}/commits/{hash}/branches-where-head",
+                cache_ttl=SHORT_CACHE_TTL,
+            ),
+            self.fetch(
+                "https://api.github.com/graphql",
+                method="POST",
+                payload={
+                    "query": COMMIT_DETAILS_QUERY,
+                    "variables": {"owner": owner, "name": name, "oid": hash},
+                },
+                cache_ttl=SHORT_CACHE_TTL,
+            ),
+        )
+        repository = properties["data"]["repository"]
+        check_runs = []
+        if repository["object"]:
+            for suite in repository["object"]["checkSuites"]["nodes"]:
+                check_runs.extend(suite["checkRuns"]["nodes"])
+        return CommitDetails(
+            branches=[branch["name"] for branch in branches],
+            check_runs=check_runs,
+        )
 
     async def pvti_team_name(self, node_id: str) -> str | None:
         """
         Returns the team name for a PVTI node id.
         """
-        query = f"""
-        {{
-          node(id: \"{node_id}\") {{
-            ... on ProjectV2Item {{
-              fieldValueByName(name: "Team") {{
-                ... on ProjectV2ItemFieldSingleSelectValue {{
+        query = """
+        query ($id: ID!) {
+          node(id: $id) {
+            ... on ProjectV2Item {
+              fieldValueByName(name: "Team") {
+                ... on ProjectV2ItemFieldSingleSelectValue {
                   name
-                }}
-              }}
-            }}
-          }}
-        }}
+                }
+              }
+            }
+          }
+        }
         """
         properties = await self.fetch(
             "https://api.github.com/graphql",
             method="POST",
-            data=json.dumps({"query": query}),
+            payload={"query": query, "variables": {"id": node_id}},
         )
         field_value_by_name = properties["data"]["node"]["fieldValueByName"]
         if not field_value_by_name:
@@ -149,25 +843,25 @@ class GitHub:
         """
         Title and URL for a PVT node id.
         """
-        query = f"""
-        {{
-          node(id: \"{id}\") {{
-            ... on ProjectV2 {{
+        query = """
+        query ($id: ID!) {
+          node(id: $id) {
+            ... on ProjectV2 {
               url
               title
-              owner {{
-                ... on Organization {{
+              owner {
+                ... on Organization {
                   login
-                }}
-              }}
-            }}
-          }}
-        }}
+                }
+              }
+            }
+          }
+        }
         """
         properties = await self.fetch(
             "https://api.github.com/graphql",
             method="POST",
-            data=json.dumps({"query": query}),
+            payload={"query": query, "variables": {"id": id}},
         )
         return (
             properties["data"]["node"]["title"],
@@ -181,12 +875,8 @@ class GitHub:
         *,
         organization: str = "uf-mil-electrical",
     ) -> list[dict[str, Any]]:
-        previous_monday_midnight = (
-            datetime.datetime.now().astimezone()
-            - datetime.timedelta(
-                days=datetime.datetime.now().weekday(),
-            )
-        )
+        now = datetime.datetime.now().astimezone()
+        previous_monday_midnight = now - datetime.timedelta(days=now.weekday())
         previous_monday_midnight = previous_monday_midnight.replace(
             hour=0,
             minute=0,
@@ -194,61 +884,27 @@ class GitHub:
             microsecond=0,
         )
         previous_monday_format = previous_monday_midnight.isoformat()
-        query = f"""
-        {{
-            viewer {{
-              login
-            }}
-            organization(login: "{organization}") {{
-            repositories(first: 10, orderBy: {{field: PUSHED_AT, direction: DESC}}) {{
-              nodes {{
-                refs(first: 30, refPrefix: "refs/heads/") {{
-                  nodes {{
-                    ... on Ref {{
-                      name
-                      target {{
-                        ... on Commit {{
-                          history(first: 10, since: "{previous_monday_format}") {{
-                            nodes {{
-                              ... on Commit {{
-                                author {{
-                                  date
-                                  email
-                                  user {{
-                                    login
-                                  }}
-                                }}
-                                oid
-                                message
-                                repository {{
-                                  nameWithOwner
-                                }}
-                              }}
-                            }}
-                          }}
-                        }}
-                      }}
-                    }}
-                  }}
-                }}
-              }}
-            }}
-          }}
-        }}
-        """
+        viewer = await self.get_viewer(user_token)
         properties = await self.fetch(
             "https://api.github.com/graphql",
             method="POST",
-            data=json.dumps({"query": query}),
+            payload={
+                "query": BRANCH_COMMITS_QUERY,
+                "variables": {
+                    "organization": organization,
+                    "since": previous_monday_format,
+                    "authorId": viewer["id"],
+                },
+            },
             user_access_token=user_token,
         )
-        commits = []
-        login = properties["data"]["viewer"]["login"]
-        for repo in properties["data"]["organization"]["repositories"]["nodes"]:
-            for branch in repo["refs"]["nodes"]:
-                for commit in branch["target"]["history"]["nodes"]:
-                    if commit["author"]["user"]["login"] == login:
-                        commits.append(commit)
+        # The history is already filtered to the viewer's commits by GitHub
+        commits = [
+            commit
+            for repo in properties["data"]["organization"]["repositories"]["nodes"]
+            for branch in repo["refs"]["nodes"]
+            for commit in branch["target"]["history"]["nodes"]
+        ]
         commits.sort(
             key=lambda commit: datetime.datetime.fromisoformat(
                 commit["author"]["date"],
@@ -268,26 +924,26 @@ class GitHub:
         Args:
             id(str): Example: I_kwDOMh6AdM6SllQd
         """
-        query = f"""
-        query {{
-            node(id: \"{id}\") {{
-                ... on Issue {{
+        query = """
+        query ($id: ID!) {
+            node(id: $id) {
+                ... on Issue {
                     title
                     number
                     url
-                }}
-                ... on PullRequest {{
+                }
+                ... on PullRequest {
                     title
                     number
                     url
-                }}
-            }}
-        }}
+                }
+            }
+        }
         """
         properties = await self.fetch(
             "https://api.github.com/graphql",
             method="POST",
-            data=json.dumps({"query": query}),
+            payload={"query": query, "variables": {"id": id}},
         )
         return (
             properties["data"]["node"]["title"],
@@ -302,39 +958,38 @@ class GitHub:
         Args:
             node_id(str): Example: PVT_kwDOCpvu5c4AmagB
         """
-        query = f"""
-        query {{
-          node(id: \"{node_id}\") {{
-            ... on ProjectV2 {{
+        query = """
+        query ($id: ID!) {
+          node(id: $id) {
+            ... on ProjectV2 {
               title
-            }}
-          }}
-        }}
+            }
+          }
+        }
         """
         properties = await self.fetch(
             "https://api.github.com/graphql",
             method="POST",
-            data=json.dumps({"query": query}),
+            payload={"query": query, "variables": {"id": node_id}},
         )
         return properties["data"]["node"]["title"]
 
-    async def get_checks(self, repo_name: str, hash: str) -> CheckRunsData:
-        url = f"https://api.github.com/repos/{repo_name}/commits/{hash}/check-runs"
-        extra_headers = {
-            "Accept": "application/vnd.github.v3+json",
-        }
-        return await self.fetch(url, extra_headers=extra_headers)
-
     async def search_commits(self, hash: str) -> CommitSearchResults:
         url = f"https://api.github.com/search/commits?q=hash:{hash}+org:uf-mil+org:uf-mil-electrical"
         headers = {
             "Accept": "application/vnd.github.cloak-preview",  # Required for commit search
         }
-        return await self.fetch(url, extra_headers=headers)
+        return await self.fetch(
+            url,
+            extra_headers=headers,
+            cache_ttl=SHORT_CACHE_TTL,
+        )
 
     async def get_user(self, username: str) -> User:
-        url = f"https://api.github.com/users/{username}"
-        return await self.fetch(url)
+        # Usernames are case-insensitive, so differently cased lookups of the
+        # same user share one cache entry
+        url = f"https://api.github.com/users/{username.lower()}"
+        return await self.fetch(url, cache_ttl=LONG_CACHE_TTL)
 
     async def invite_user_to_org(
         self,
@@ -352,96 +1007,48 @@ class GitHub:
         }
         if team_id:
             data["team_ids"] = [team_id]
-        str_data = json.dumps(data)
         return await self.fetch(
             url,
             method="POST",
             extra_headers=extra_headers,
-            data=str_data,
+            payload=data,
             user_access_token=user_access_token,
         )
 
     async def get_team(self, org_name: str, team_name: str) -> OrganizationTeam:
         url = f"https://api.github.com/orgs/{org_name}/teams/{team_name}"
-        return await self.fetch(url)
+        return await self.fetch(url, cache_ttl=LONG_CACHE_TTL)
 
-    async def get_software_projects(self) -> list[SoftwareProject]:
-        query = """
-            query {
-              viewer {
-                organization(login: "uf-mil") {
-                  projectsV2(first: 15, query: "is:open") {
-                    nodes {
-                      title
-                      number
-                      shortDescription
-                      items(first: 10) {
-                        nodes {
-                          type
-                          id
-                          content {
-                            ... on Issue {
-                              state
-                              title
-                              number
-                            }
-                          }
-                          fieldValues(first: 5){
-                            nodes {
-                              ... on ProjectV2ItemFieldDateValue {
-                                date
-                                field {
-                                  ... on ProjectV2Field {
-                                    name
-                                  }
-                                }
-                              }
-                              ... on ProjectV2ItemFieldSingleSelectValue {
-                                name
-                                field {
-                                  ... on ProjectV2SingleSelectField {
-                                    name
-                                  }
-                                }
-                              }
-                              ... on ProjectV2ItemFieldUserValue {
-                                users(first: 4) {
-                                  nodes {
-                                    login
-                                    name
-                                  }
-                                }
-                                field {
-                                  ... on ProjectV2Field {
-                                    name
-                                  }
-                                }
-                              }
-                            }
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-              rateLimit {
-                limit
-                remaining
-                used
-                resetAt
-              }
-            }
+    async def get_developers_team_id(self, *, refresh: bool = False) -> int:
         """
-        properties = await self.fetch(
-            "https://api.github.com/graphql",
-            method="POST",
-            data=json.dumps({"query": query}),
-        )
+        Returns the ID of the "developers" team in uf-mil. The ID is only
+        fetched once unless a refresh is requested.
+        """
+        if self._developers_team_id is None or refresh:
+            team = await self.get_team("uf-mil", "developers")
+            self._developers_team_id = team["id"]
+        return self._developers_team_id
+
+    async def get_software_projects(self) -> list[SoftwareProject]:
+        project_nodes = []
+        cursor = None
+        while True:
+            properties = await self.fetch(
+                "https://api.github.com/graphql",
+                method="POST",
+                payload={
+                    "query": SOFTWARE_PROJECTS_QUERY,
+                    "variables": {"cursor": cursor},
+                },
+            )
+            projects_v2 = properties["data"]["viewer"]["organization"]["projectsV2"]
+            project_nodes.extend(projects_v2["nodes"])
+            if not projects_v2["pageInfo"]["hasNextPage"]:
+                break
+            cursor = projects_v2["pageInfo"]["endCursor"]
+
         projects = []
-        for project_node in properties["data"]["viewer"]["organization"]["projectsV2"][
-            "nodes"
-        ]:
+        for project_node in project_nodes:
             if (
                 not project_node["title"]
                 or "untitled" in project_node["title"]
@@ -450,11 +1057,59 @@ class GitHub:
                 or "on hold" in project_node["shortDescription"]
             ):
                 continue
+            # Only projects with many items need more than the first query
+            items = project_node["items"]
+            if items["pageInfo"]["hasNextPage"]:
+                items["nodes"].extend(
+                    await self._remaining_project_items(
+                        project_node["id"],
+                        items["pageInfo"]["endCursor"],
+                    ),
+                )
             project = SoftwareProject(project_node)
             projects.append(project)
         projects.sort(key=lambda p: p.title)
         return projects
 
+    async def _remaining_project_items(
+        self,
+        project_id: str,
+        cursor: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Returns the items of a project after the given cursor.
+        """
+        nodes = []
+        while True:
+            properties = await self.fetch(
+                "https://api.github.com/graphql",
+                method="POST",
+                payload={
+                    "query": PROJECT_ITEMS_QUERY,
+                    "variables": {"id": project_id, "cursor": cursor},
+                },
+            )
+            items = properties["data"]["node"]["items"]
+            nodes.extend(items["nodes"])
+            if not items["pageInfo"]["hasNextPage"]:
+                return nodes
+            cursor = items["pageInfo"]["endCursor"]
+
+    async def get_viewer(self, user_token: str) -> dict[str, str]:
+        """
+        Returns the login and node ID of the user that the access token belongs to.
+        This never changes for a token, so it is only fetched once per token.
+        """
+        if user_token not in self._viewers:
+            properties = await self.fetch(
+                "https://api.github.com/graphql",
+                method="POST",
+                payload={"query": "query { viewer { login id } }"},
+                user_access_token=user_token,
+            )
+            self._viewers[user_token] = properties["data"]["viewer"]
+        return self._viewers[user_token]
+
     async def get_user_contributions(
         self,
         user_token: str,
@@ -465,105 +1120,9 @@ class GitHub:
             end = datetime.datetime.now().astimezone()
         start = start.astimezone()
         start_format = start.isoformat()
-        query = f"""query {{
-          rateLimit {{
-            remaining
-            limit
-            used
-            cost
-          }}
-          viewer {{
-            login
-            issueComments(first: 100, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
-              nodes {{
-                bodyText
-                createdAt
-                issue {{
-                  title
-                  number
-                }}
-                repository {{
-                  nameWithOwner
-                  name
-                  owner {{
-                    login
-                  }}
-                }}
-              }}
-            }}
-            pullRequests(last: 100) {{
-              nodes {{
-                title
-                number
-                createdAt
-                author {{
-                  login
-                }}
-                repository {{
-                    nameWithOwner
-                    name
-                    owner {{
-                        login
-                    }}
-                }}
-              }}
-            }}
-            issues(first: 100, filterBy: {{since: "{start_format}"}}) {{
-              nodes {{
-                title
-                createdAt
-                number
-                author {{
-                  login
-                }}
-                repository {{
-                  nameWithOwner
-                  name
-                  owner {{
-                    login
-                  }}
-                }}
-              }}
-            }}
-          }}
-        }}
-        """
-        properties = await self.fetch(
-            "https://api.github.com/graphql",
-            method="POST",
-            data=json.dumps({"query": query}),
-            user_access_token=user_token,
-        )
-        username = properties["data"]["viewer"]["login"]
-        filtered_issue_comments = [
-            comment
-            for comment in properties["data"]["viewer"]["issueComments"]["nodes"]
-            if end > datetime.datetime.fromisoformat(comment["createdAt"]) > start
-            and comment["repository"]["owner"]["login"].startswith("uf-mil")
-        ]
-        filtered_issue_comments.sort(
-            key=lambda comment: datetime.datetime.fromisoformat(comment["createdAt"]),
-            reverse=True,
-        )
-        filtered_pull_requests = [
-            pr
-            for pr in properties["data"]["viewer"]["pullRequests"]["nodes"]
-            if pr["author"]["login"] == username
-            and pr["repository"]["owner"]["login"].startswith("uf-mil")
-            and end > datetime.datetime.fromisoformat(pr["createdAt"]) > start
-        ]
-        filtered_pull_requests.sort(
-            key=lambda pr: datetime.datetime.fromisoformat(pr["createdAt"]),
-            reverse=True,
-        )
-        filtered_issues = [
-            issue
-            for issue in properties["data"]["viewer"]["issues"]["nodes"]
-            if issue["author"]["login"] == username
-            and issue["repository"]["owner"]["login"].startswith("uf-mil")
-            and end > datetime.datetime.fromisoformat(issue["createdAt"]) > start
-        ]
-
+        # The commit search only needs the username, so it can run at the same
+        # time as the (much larger) GraphQL query
+        username = (await self.get_viewer(user_token))["login"]
         commits_call = (
             "https://api.github.com"
             + "/search/commits?q=author:"
@@ -571,7 +1130,53 @@ class GitHub:
             + "+org:uf-mil+org:uf-mil-electrical+org:uf-mil-mechanical+committer-date:>="
             + start_format
         )
-        commits = await self.fetch(commits_call, user_access_token=user_token)
+        properties, commits = await asyncio.gather(
+            self.fetch(
+                "https://api.github.com/graphql",
+                method="POST",
+                payload={
+                    "query": USER_CONTRIBUTIONS_QUERY,
+                    "variables": {
+                        "since": start_format,
+                        # Search can't match organizations by prefix, so every
+                        # uf-mil* organization is filtered for below
+                        "pullRequestsQuery": f"is:pr author:{username} created:>={start_format}",
+                    },
+                },
+                user_access_token=user_token,
+            ),
+            self.fetch(commits_call, user_access_token=user_token),
+        )
+        data = properties["data"]
+        viewer = data["viewer"]
+        filtered_issue_comments = _created_between(
+            (
+                comment
+                for comment in viewer["issueComments"]["nodes"]
+                if comment["repository"]["owner"]["login"].startswith("uf-mil")
+            ),
+            start,
+            end,
+        )
+        filtered_pull_requests = _created_between(
+            (
+                pull_request
+                for pull_request in data["pullRequests"]["nodes"]
+                if pull_request["repository"]["owner"]["login"].startswith("uf-mil")
+            ),
+            start,
+            end,
+        )
+        filtered_issues = _created_between(
+            (
+                issue
+                for issue in viewer["issues"]["nodes"]
+                if issue["author"]["login"] == username
+                and issue["repository"]["owner"]["login"].startswith("uf-mil")
+            ),
+            start,
+            end,
+        )
         commits = commits["items"]
         commits.sort(
             key=lambda commit: datetime.datetime.fromisoformat(
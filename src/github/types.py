@@ -378,7 +378,7 @@ class SoftwareProjectStatus(Enum):
     WISHLIST = "Wishlist"
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class SoftwareProjectItemAssignee:
     name: str
     login: str
@@ -389,29 +389,24 @@ class SoftwareProjectItemAssignee:
 
 
 class SoftwareProjectItem:
+    __slots__ = ("assignees", "due_date", "issue_number", "issue_title", "status")
+
     issue_number: int
     issue_title: str
     assignees: list[SoftwareProjectItemAssignee]
     status: SoftwareProjectStatus | None
     due_date: datetime.datetime | None
 
-    def _get_field(
-        self,
-        nodes: list[dict[str, Any]],
-        field_name: str,
-    ) -> dict[str, Any] | None:
-        for node in nodes:
-            if len(node.items()) == 0:
-                continue
-            if node["field"]["name"] == field_name:
-                return node
-        return None
-
     def __init__(self, properties: dict[str, Any]):
         self.issue_number = properties["content"]["number"]
         self.issue_title = properties["content"]["title"]
-        nodes = properties["fieldValues"]["nodes"]
-        assignee_field = self._get_field(nodes, "Assignees")
+        # Field values that don't match any fragment in the query are empty
+        fields = {
+            node["field"]["name"]: node
+            for node in properties["fieldValues"]["nodes"]
+            if node
+        }
+        assignee_field = fields.get("Assignees")
         if assignee_field:
             self.assignees = [
                 SoftwareProjectItemAssignee(assignee)
@@ -419,12 +414,12 @@ class SoftwareProjectItem:
             ]
         else:
             self.assignees = []
-        status_field = self._get_field(nodes, "Status")
+        status_field = fields.get("Status")
         if status_field:
             self.status = SoftwareProjectStatus(status_field["name"])
         else:
             self.status = None
-        due_date_field = self._get_field(nodes, "Due Date")
+        due_date_field = fields.get("Due Date")
         if due_date_field:
             self.due_date = datetime.datetime.fromisoformat(due_date_field["date"])
         else:
@@ -432,43 +427,49 @@ class SoftwareProjectItem:
 
 
 class SoftwareProject:
+    __slots__ = (
+        "emoji",
+        "items",
+        "leader_names",
+        "number",
+        "short_description",
+        "title",
+        "unassigned_items",
+        "url",
+    )
+
     title: str
     emoji: str
     short_description: str
     number: int
     items: list[SoftwareProjectItem]
+    # Projects are not modified after being fetched, so these are only
+    # computed once
+    unassigned_items: list[SoftwareProjectItem]
+    url: str
+    leader_names: list[str]
 
-    LEADS_REGEX = r"\(lead: ([\w\s,]+)\)"
+    LEADS_REGEX = re.compile(r"\(lead: ([\w\s,]+)\)")
 
     def __init__(self, properties: dict[str, Any]):
         self.title = properties["title"]
         self.number = properties["number"]
-        self.short_description = properties["shortDescription"]
-        try:
-            split = properties["shortDescription"].split(" ")
-            self.emoji = split[0]
-            self.short_description = " ".join(split[1:])
-        except Exception:
+        # Descriptions start with the emoji for the project
+        emoji, sep, short_description = properties["shortDescription"].partition(" ")
+        if sep:
+            self.emoji = emoji
+            self.short_description = short_description
+        else:
             self.emoji = "❓"
-        self.items = []
-        for item in properties["items"]["nodes"]:
-            item = SoftwareProjectItem(item)
-            self.items.append(item)
-
-    @property
-    def unassigned_items(self) -> list[SoftwareProjectItem]:
-        return [
+            self.short_description = properties["shortDescription"]
+        self.items = [
+            SoftwareProjectItem(item) for item in properties["items"]["nodes"]
+        ]
+        self.unassigned_items = [
             item
             for item in self.items
             if len(item.assignees) == 0 and item.status != SoftwareProjectStatus.DONE
         ]
-
-    @property
-    def url(self) -> str:
-        return f"https://github.com/orgs/uf-mil/projects/{self.number}"
-
-    def leader_names(self) -> list[str]:
-        finds = re.findall(self.LEADS_REGEX, self.short_description)
-        if finds:
-            return [s.strip() for s in finds[0].split(",")]
-        return []
+        self.url = f"https://github.com/orgs/uf-mil/projects/{self.number}"
+        match = self.LEADS_REGEX.search(self.short_description)
+        self.leader_names = [s.strip() for s in match[1].split(",")] if match else []
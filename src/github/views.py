@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Literal
 
@@ -14,6 +15,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+GitHubInviteOrg = Literal["uf-mil", "uf-mil-electrical", "uf-mil-mechanical"]
+# Organizations that members can be invited to, and the custom ID of the button
+# for each. The custom IDs must stay the same for previously sent views to work.
+GITHUB_INVITE_BUTTONS: list[tuple[GitHubInviteOrg, str]] = [
+    ("uf-mil", "github_invite:software"),
+    ("uf-mil-electrical", "github_invite:electrical"),
+    ("uf-mil-mechanical", "github_invite:mechanical"),
+]
+
 
 class GitHubUsernameModal(MILBotModal):
 
@@ -22,7 +32,7 @@ class GitHubUsernameModal(MILBotModal):
     def __init__(
         self,
         bot: MILBot,
-        org_name: Literal["uf-mil", "uf-mil-electrical", "uf-mil-mechanical"],
+        org_name: GitHubInviteOrg,
     ):
         self.bot = bot
         self.org_name = org_name
@@ -36,18 +46,21 @@ class GitHubUsernameModal(MILBotModal):
             username: The username of the user to invite.
             org_name: The name of the organization to invite the user to.
         """
-        username = self.username.value
+        username = self.username.value.strip()
         # Ensure that the specified username is actually a GitHub user, and get
-        # their user object
-        try:
-            user = await self.bot.github.get_user(username)
-        except aiohttp.ClientResponseError as e:
-            if e.status == 404:
-                await interaction.response.send_message(
-                    f"Failed to find user with username {username}.",
-                    ephemeral=True,
-                )
-            raise e
+        # their user object. uf-mil invites also need the "Developers" team ID,
+        # which is looked up at the same time.
+        lookups = [self.bot.github.get_user(username)]
+        if self.org_name == "uf-mil":
+            lookups.append(self.bot.github.get_developers_team_id())
+        user, *team_ids = await asyncio.gather(*lookups, return_exceptions=True)
+        if isinstance(user, aiohttp.ClientResponseError) and user.status == 404:
+            return await interaction.response.send_message(
+                f"Failed to find user with username {username}.",
+                ephemeral=True,
+            )
+        if isinstance(user, BaseException):
+            raise user
 
         async with self.bot.db_factory() as db:
             oauth_user = await db.get_github_oauth_member(interaction.user.id)
@@ -59,13 +72,32 @@ class GitHubUsernameModal(MILBotModal):
         try:
             # If the org is uf-mil, invite to the "Developers" team
             if self.org_name == "uf-mil":
-                team = await self.bot.github.get_team(self.org_name, "developers")
-                await self.bot.github.invite_user_to_org(
-                    user["id"],
-                    self.org_name,
-                    team["id"],
-                    oauth_user.access_token,
-                )
+                team_id = team_ids[0]
+                if isinstance(team_id, BaseException):
+                    raise team_id
+                try:
+                    await self.bot.github.invite_user_to_org(
+                        user["id"],
+                        self.org_name,
+                        team_id,
+                        oauth_user.access_token,
+                    )
+                except aiohttp.ClientResponseError as e:
+                    # The team ID is remembered, so if the team was recreated the
+                    # invite is rejected; look it up again and retry if it changed
+                    if e.status != 422:
+                        raise
+                    refreshed_team_id = await self.bot.github.get_developers_team_id(
+                        refresh=True,
+                    )
+                    if refreshed_team_id == team_id:
+                        raise
+                    await self.bot.github.invite_user_to_org(
+                        user["id"],
+                        self.org_name,
+                        refreshed_team_id,
+                        oauth_user.access_token,
+                    )
             else:
                 await self.bot.github.invite_user_to_org(
                     user["id"],
@@ -98,47 +130,25 @@ class GitHubUsernameModal(MILBotModal):
             )
 
 
-class GitHubInviteView(MILBotView):
-    def __init__(self, bot: MILBot):
+class GitHubInviteButton(discord.ui.Button):
+    def __init__(self, bot: MILBot, org_name: GitHubInviteOrg, custom_id: str):
         self.bot = bot
-        super().__init__(timeout=None)
-
-    @discord.ui.button(
-        label="Invite to uf-mil",
-        style=discord.ButtonStyle.secondary,
-        custom_id="github_invite:software",
-    )
-    async def invite_to_uf_mil(
-        self,
-        interaction: discord.Interaction,
-        _: discord.ui.Button,
-    ):
-        await interaction.response.send_modal(GitHubUsernameModal(self.bot, "uf-mil"))
-
-    @discord.ui.button(
-        label="Invite to uf-mil-electrical",
-        style=discord.ButtonStyle.secondary,
-        custom_id="github_invite:electrical",
-    )
-    async def invite_to_uf_mil_electrical(
-        self,
-        interaction: discord.Interaction,
-        _: discord.ui.Button,
-    ):
-        await interaction.response.send_modal(
-            GitHubUsernameModal(self.bot, "uf-mil-electrical"),
+        self.org_name = org_name
+        super().__init__(
+            style=discord.ButtonStyle.secondary,
+            label=f"Invite to {org_name}",
+            custom_id=custom_id,
         )
 
-    @discord.ui.button(
-        label="Invite to uf-mil-mechanical",
-        style=discord.ButtonStyle.secondary,
-        custom_id="github_invite:mechanical",
-    )
-    async def invite_to_uf_mil_mechanical(
-        self,
-        interaction: discord.Interaction,
-        _: discord.ui.Button,
-    ):
+    async def callback(self, interaction: discord.Interaction):
         await interaction.response.send_modal(
-            GitHubUsernameModal(self.bot, "uf-mil-mechanical"),
+            GitHubUsernameModal(self.bot, self.org_name),
         )
+
+
+class GitHubInviteView(MILBotView):
+    def __init__(self, bot: MILBot):
+        self.bot = bot
+        super().__init__(timeout=None)
+        for org_name, custom_id in GITHUB_INVITE_BUTTONS:
+            self.add_item(GitHubInviteButton(bot, org_name, custom_id))
@@ -7,8 +7,11 @@ from __future__ import annotations
 import asyncio
 import calendar
 import datetime
+import logging
 import re
 import time
+import weakref
+from collections.abc import Awaitable, Callable, Iterable
 from typing import TYPE_CHECKING
 
 import discord
@@ -27,6 +30,8 @@ if TYPE_CHECKING:
     from .bot import MILBot
 
 
+logger = logging.getLogger(__name__)
+
 MEETING_TIME = datetime.time(15, 0, 0)
 MEETING_DAY = calendar.THURSDAY
 
@@ -36,6 +41,29 @@ MARCH = 3
 JUNE = 6
 SEPTEMBER = 9
 
+# How long a pinger goes without being re-notified about the same away member
+AWAY_COOLDOWN = datetime.timedelta(days=1)
+
+# (label, URL, emoji) for each team's roadmap button in meeting reminders;
+# roadmaps without a URL are shown disabled
+ROADMAP_BUTTONS: tuple[tuple[str, str | None, str], ...] = (
+    (
+        "Roadmap: uf-mil-leadership",
+        "https://github.com/orgs/uf-mil-leadership/projects/4",
+        "📈",
+    ),
+    (
+        "Roadmap: uf-mil-mechanical",
+        "https://github.com/orgs/uf-mil-mechanical/projects/13",
+        "🔧",
+    ),
+    ("Roadmap: uf-mil-electrical", None, "🔋"),
+    ("Roadmap: uf-mil", None, "🔌"),
+)
+
+# Maximum number of member role edits sent to Discord at once
+ROLE_EDIT_CONCURRENCY = 5
+
 
 class AwayView(MILBotView):
     def __init__(self, bot: MILBot):
@@ -71,9 +99,13 @@ class AwayView(MILBotView):
 
 class Leaders(commands.Cog):
 
-    away_cooldown: dict[discord.Member, list[tuple[discord.Member, datetime.datetime]]]
-    protected_channel_names: list[str]
-    perm_notify_lock: asyncio.Lock
+    # (away member ID, pinger ID) -> time.monotonic() of the last notification
+    away_cooldown: dict[tuple[int, int], float]
+    protected_channel_names: re.Pattern[str]
+    # Channel or member ID -> lock serializing permission notifications for it
+    perm_notify_locks: weakref.WeakValueDictionary[int, asyncio.Lock]
+    # Guild ID -> text channels matching protected_channel_names
+    _important_channels: dict[int, list[discord.TextChannel]]
 
     def __init__(self, bot: MILBot):
         self.bot = bot
@@ -88,13 +120,11 @@ class Leaders(commands.Cog):
         self.new_grad_to_alumni_fall.start(self)
         self.new_grad_to_alumni_spring.start(self)
         self.away_cooldown = {}
-        self.protected_channel_names = [
-            r"^.*leads$",
-            "^students-only$",
-            "^.*-travel$",
-            r"^.*-leadership$",
-        ]
-        self.perm_notify_lock = asyncio.Lock()
+        self.protected_channel_names = re.compile(
+            r"^(?:.*leads|students-only|.*-travel|.*-leadership)$",
+        )
+        self.perm_notify_locks = weakref.WeakValueDictionary()
+        self._important_channels = {}
 
     @run_yearly(MARCH, 1)
     async def new_grad_to_alumni_fall(self):
@@ -104,9 +134,38 @@ class Leaders(commands.Cog):
     async def new_grad_to_alumni_spring(self):
         await self.new_grad_to_alumni()
 
+    async def _edit_members(
+        self,
+        members: Iterable[discord.Member],
+        edit: Callable[[discord.Member], Awaitable[object]],
+    ):
+        """
+        Runs the given edit for each member concurrently, logging any failures
+        instead of stopping at the first one.
+        """
+        members = list(members)
+        semaphore = asyncio.Semaphore(ROLE_EDIT_CONCURRENCY)
+
+        async def run(member: discord.Member):
+            async with semaphore:
+                await edit(member)
+
+        results = await asyncio.gather(
+            *(run(member) for member in members),
+            return_exceptions=True,
+        )
+        for member, result in zip(members, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Failed to update roles for {member}.",
+                    exc_info=result,
+                )
+
     async def new_grad_to_alumni(self):
-        for new_grad in self.bot.new_grad_role.members:
-            await new_grad.remove_roles(self.bot.new_grad_role)
+        await self._edit_members(
+            self.bot.new_grad_role.members,
+            lambda member: member.remove_roles(self.bot.new_grad_role),
+        )
 
     @run_yearly(JANUARY, 1)
     async def demote_new_grads_fall(self):
@@ -125,9 +184,13 @@ class Leaders(commands.Cog):
         await self.notify_lead_removal()
 
     async def demote_new_grads(self):
-        for member in self.bot.new_grad_role.members:
-            no_leads_roles = [r for r in member.roles if "Lead" not in r.name]
-            await member.edit(roles=no_leads_roles, reason="Leader has graduated.")
+        await self._edit_members(
+            self.bot.new_grad_role.members,
+            lambda member: member.edit(
+                roles=[r for r in member.roles if "Lead" not in r.name],
+                reason="Leader has graduated.",
+            ),
+        )
 
     async def notify_lead_removal(self):
         demoting_members = [member.mention for member in self.bot.new_grad_role.members]
@@ -205,31 +268,39 @@ class Leaders(commands.Cog):
             electrical_file: [],
             mechanical_file: [],
         }
+        members_by_name: dict[str, list[discord.Member]] = {}
+        for member in self.bot.active_guild.members:
+            members_by_name.setdefault(member.display_name.lower(), []).append(member)
         for file in [software_file, electrical_file, mechanical_file]:
             if not file:
                 continue
-            for name in (await file.read()).decode().split("\n"):
-                name = name.strip()
-                if not name:
-                    continue
-                was_added = False
-                for member in self.bot.active_guild.members:
-                    if member.display_name.lower() == name.lower():
-                        team_role = discord.utils.get(
-                            self.bot.active_guild.roles,
-                            name=f"EGN4912 {team_names[file]}",
-                        )
-                        if not team_role:
-                            await ctx.reply(
-                                f"Could not find the role for {team_names[file]} team. Please create the role and try again.",
-                            )
-                            return
-                        roles_to_add = {team_role, self.bot.egn4912_role}
-                        await member.add_roles(*(roles_to_add - set(member.roles)))
-                        added_successfully[file] += 1
-                        was_added = True
-                if not was_added:
+            team_role = discord.utils.get(
+                self.bot.active_guild.roles,
+                name=f"EGN4912 {team_names[file]}",
+            )
+            if not team_role:
+                await ctx.reply(
+                    f"Could not find the role for {team_names[file]} team. Please create the role and try again.",
+                )
+                return
+            roles_to_add = {team_role, self.bot.egn4912_role}
+            # Collect the names first so the download isn't held open (and
+            # can't time out) while roles are being added
+            names = []
+            async with self.bot.session.get(file.url) as response:
+                response.raise_for_status()
+                async for line in response.content:
+                    name = line.decode().strip()
+                    if name:
+                        names.append(name)
+            for name in names:
+                matches = members_by_name.get(name.lower())
+                if not matches:
                     could_not_find[file].append(name)
+                    continue
+                for member in matches:
+                    await member.add_roles(*(roles_to_add - set(member.roles)))
+                    added_successfully[file] += 1
             await ctx.reply(
                 f"{team_names[file]} team: {added_successfully[file]} members added successfully. Could not find: {', '.join(could_not_find[file])}",
             )
@@ -243,19 +314,21 @@ class Leaders(commands.Cog):
         if self.bot.leaders_role not in member.roles:
             await ctx.reply("Sorry, you must be a leader to use this command!")
             return
-        members: list[discord.Member] = []
-        for member in self.bot.active_guild.members:
-            if name.lower() in member.display_name.lower() or (
-                member.global_name and name.lower() in member.global_name.lower()
-            ):
-                members.append(member)
+        name = name.lower()
+        members: list[discord.Member] = [
+            member
+            for member in self.bot.active_guild.members
+            if name in member.display_name.lower()
+            or (member.global_name and name in member.global_name.lower())
+        ]
         if not members:
             await ctx.reply("No members found.")
             return
         members = sorted(members, key=lambda x: x.display_name)
+        default_role = self.bot.active_guild.default_role
         formatted_members = []
         for member in members:
-            useful_roles = set(member.roles) - {self.bot.active_guild.default_role}
+            useful_roles = set(member.roles) - {default_role}
             roles = ", ".join(role.name for role in useful_roles)
             formatted_members.append(
                 f"* {member.display_name} ({member.mention}) - Roles: {roles}",
@@ -274,22 +347,26 @@ class Leaders(commands.Cog):
         competition_end: datetime.date,
     ) -> str:
         today = datetime.date.today()
-        symbols = []
+        today_week = today.strftime("%U")
         days = (competition_end - start_date).days + 1
 
         annotations = {}
+        weeks: dict[str, list[str]] = {}
 
+        week_start = start_date - datetime.timedelta(
+            days=(start_date.weekday() + 1) % 7,
+        )
+        week_format = week_start.strftime("%b %d")
         for i in range(days):
             current_date = start_date + datetime.timedelta(days=i)
-            week_start = current_date - datetime.timedelta(
-                days=(current_date.weekday() + 1) % 7,
-            )
-            week_format = week_start.strftime("%b %d")
+            # Weeks start on Sunday
+            if i and current_date.weekday() == calendar.SUNDAY:
+                week_format = current_date.strftime("%b %d")
             if current_date < today:
                 symbol = " "
             elif current_date == today:
                 symbol = "X"
-            elif current_date.strftime("%U") == today.strftime("%U"):
+            elif current_date.strftime("%U") == today_week:
                 symbol = "x"
             elif current_date < competition_start:
                 symbol = (
@@ -311,15 +388,6 @@ class Leaders(commands.Cog):
                 annotations[week_format] = "← competition start"
             if current_date == competition_end:
                 annotations[week_format] = "← competition end"
-            symbols.append(symbol)
-
-        weeks = {}
-        for i, symbol in enumerate(symbols):
-            current_date = start_date + datetime.timedelta(days=i)
-            week_start = current_date - datetime.timedelta(
-                days=(current_date.weekday() + 1) % 7,
-            )
-            week_format = week_start.strftime("%b %d")
             weeks.setdefault(week_format, []).append(symbol)
 
         final_string = []
@@ -360,27 +428,17 @@ class Leaders(commands.Cog):
             view.add_item(
                 discord.ui.Button(label="Meeting Link", url=LEADERS_MEETING_URL),
             )
-        buttons = [
-            discord.ui.Button(
-                label="Roadmap: uf-mil-leadership",
-                url="https://github.com/orgs/uf-mil-leadership/projects/4",
-                emoji="📈",
-            ),
-            discord.ui.Button(
-                label="Roadmap: uf-mil-mechanical",
-                url="https://github.com/orgs/uf-mil-mechanical/projects/13",
-                emoji="🔧",
-            ),
-            discord.ui.Button(
-                label="Roadmap: uf-mil-electrical",
-                emoji="🔋",
-                disabled=True,
-            ),
-            discord.ui.Button(label="Roadmap: uf-mil", emoji="🔌", disabled=True),
-        ]
-        for i, button in enumerate(buttons):
-            button.row = i + 1 if include_meeting_link else i
-            view.add_item(button)
+        first_row = 1 if include_meeting_link else 0
+        for row, (label, url, emoji) in enumerate(ROADMAP_BUTTONS, start=first_row):
+            view.add_item(
+                discord.ui.Button(
+                    label=label,
+                    url=url,
+                    emoji=emoji,
+                    disabled=url is None,
+                    row=row,
+                ),
+            )
         return view
 
     @run_on_weekday(
@@ -442,6 +500,37 @@ class Leaders(commands.Cog):
             view=self._meeting_view(include_meeting_link=True),
         )
 
+    def _perm_notify_lock(self, target_id: int) -> asyncio.Lock:
+        """
+        Returns the lock for permission notifications about the given channel or
+        member. Locks are dropped once nothing is holding or waiting on them.
+        """
+        lock = self.perm_notify_locks.get(target_id)
+        if lock is None:
+            lock = self.perm_notify_locks[target_id] = asyncio.Lock()
+        return lock
+
+    def important_channels(self, guild: discord.Guild) -> list[discord.TextChannel]:
+        """
+        Returns the protected text channels in the guild. The result is cached
+        until a channel in the guild is created, deleted, or updated.
+        """
+        if guild.id not in self._important_channels:
+            self._important_channels[guild.id] = [
+                c
+                for c in guild.text_channels
+                if self.protected_channel_names.match(c.name)
+            ]
+        return self._important_channels[guild.id]
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self._important_channels.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self._important_channels.pop(channel.guild.id, None)
+
     def _away_cooldown_check(
         self,
         away_member: discord.Member,
@@ -450,15 +539,14 @@ class Leaders(commands.Cog):
         """
         Returns True if pinger should be notified, False otherwise.
         """
-        if away_member in self.away_cooldown:
-            who_was_notified = self.away_cooldown[away_member]
-            for member, last_notified in who_was_notified:
-                if (
-                    member == pinger
-                    and datetime.datetime.now().astimezone() - last_notified
-                    < datetime.timedelta(days=1)
-                ):
-                    return False
+        key = (away_member.id, pinger.id)
+        last_notified = self.away_cooldown.get(key)
+        if last_notified is None:
+            return True
+        if time.monotonic() - last_notified < AWAY_COOLDOWN.total_seconds():
+            return False
+        # Expired entries are dropped so the cooldown table does not keep growing
+        del self.away_cooldown[key]
         return True
 
     @commands.command()
@@ -511,16 +599,15 @@ class Leaders(commands.Cog):
         before: discord.abc.GuildChannel,
         after: discord.abc.GuildChannel,
     ):
+        self._important_channels.pop(after.guild.id, None)
         # Do the same thing as the function below
         if not isinstance(before, discord.TextChannel) or not isinstance(
             after,
             discord.TextChannel,
         ):
             return
-        async with self.perm_notify_lock:
-            important = any(
-                re.match(name, after.name) for name in self.protected_channel_names
-            )
+        async with self._perm_notify_lock(after.id):
+            important = self.protected_channel_names.match(after.name)
             if important:
                 before_members = before.members
                 after_members = after.members
@@ -564,7 +651,7 @@ class Leaders(commands.Cog):
         # important channels
         if before.roles == after.roles:
             return
-        async with self.perm_notify_lock:
+        async with self._perm_notify_lock(after.id):
             after = await after.guild.fetch_member(after.id)
             await asyncio.sleep(1)
             entry = await self.bot.fetch_audit_log_targeting(
@@ -572,12 +659,7 @@ class Leaders(commands.Cog):
                 [discord.AuditLogAction.member_role_update],
             )
             user = "A user" if not entry else entry.user.mention
-            important_channels = [
-                c
-                for c in before.guild.text_channels
-                if any(re.match(name, c.name) for name in self.protected_channel_names)
-            ]
-            for channel in important_channels:
+            for channel in self.important_channels(after.guild):
                 member_can_view_before = channel.permissions_for(before).read_messages
                 member_can_view_after = channel.permissions_for(after).read_messages
                 if member_can_view_after and not member_can_view_before:
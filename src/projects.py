@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import calendar
+import logging
 import re
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 import discord
@@ -10,12 +13,36 @@ from discord.ext import commands, tasks
 from .constants import Team
 from .github.types import SoftwareProject, SoftwareProjectStatus
 from .tasks import run_on_weekday
+from .utils import capped_str
 from .views import MILBotView
 
 if TYPE_CHECKING:
     from .bot import MILBot
 
 
+logger = logging.getLogger(__name__)
+
+# Seconds to wait after a project webhook before refreshing the projects
+PROJECTS_WEBHOOK_REFRESH_DELAY = 10
+# Discord embed limits
+EMBED_MAX_FIELDS = 25
+EMBED_MAX_DESCRIPTION = 4096
+
+
+def members_by_display_name(
+    members: Iterable[discord.Member],
+) -> dict[str, discord.Member]:
+    """
+    Maps the lowercased display name of each member to the member, so that many
+    names can be looked up without scanning the members each time. If several
+    members share a display name, the first one is used.
+    """
+    named: dict[str, discord.Member] = {}
+    for member in members:
+        named.setdefault(member.display_name.lower(), member)
+    return named
+
+
 class ProjectSelect(discord.ui.Select):
     def __init__(self, bot: MILBot, projects: list[SoftwareProject]):
         self.bot = bot
@@ -68,11 +95,23 @@ class SoftwareProjectsView(MILBotView):
 class SoftwareProjects(commands.Cog):
 
     software_projects_cache: list[SoftwareProject]
+    # The last embed posted in #software-projects, and the message holding it
+    _projects_embed: discord.Embed | None
+    _projects_message_id: int | None
+    # Held while the projects are being refreshed, so that a webhook-triggered
+    # refresh and the regular one can't create the same channel twice
+    _refresh_lock: asyncio.Lock
+    # Waits out a burst of project webhooks before starting a refresh
+    _pending_refresh: asyncio.Task | None
 
     def __init__(self, bot: MILBot):
         self.bot = bot
         self.update_projects.start()
         self.software_projects_cache = []
+        self._projects_embed = None
+        self._projects_message_id = None
+        self._refresh_lock = asyncio.Lock()
+        self._pending_refresh = None
         self.remind_to_join_project.start(self)
         self.whosonwhat.start(self)
 
@@ -93,41 +132,65 @@ class SoftwareProjects(commands.Cog):
             and sm.team == Team.SOFTWARE
             and sm.name.lower() not in assigned
         ]
-        for member in unassigned_members:
-            embed = discord.Embed(
-                title="Looking for a Software Project?",
-                color=discord.Color.teal(),
-                description="**Our records indicate you are not currently placed onto a software task.** Looking for a software project to join? Look no further! Here are some of the projects that are currently looking for contributors.\n\nRemember that you should always be working on at least one project, and optionally more if you're interested! Each project channel will be forwarded updates and notifications relevant to the specific project.",
-            )
-            for project in self.software_projects_cache:
-                lead_members = []
-                for name in project.leader_names():
-                    member_named = discord.utils.find(
-                        lambda m: m.display_name.lower() == name.lower(),
-                        self.bot.software_projects_channel.members,
-                    )
-                    if member_named:
-                        lead_members.append(member_named.mention)
-                    else:
-                        lead_members.append(name)
-                leads = " | ".join(lead_members)
-                link = f"[/projects/{project.number}]({project.url})"
-                embed.add_field(
-                    name=f"#{project.title}",
-                    value=f"**Leaders:** {leads}, **Link:** {link}\n{project.short_description}\n**{len(project.unassigned_items)} unassigned tasks**",
-                    inline=False,
+        # The reminder is the same for everyone, so it is only built once
+        embed = discord.Embed(
+            title="Looking for a Software Project?",
+            color=discord.Color.teal(),
+            description="**Our records indicate you are not currently placed onto a software task.** Looking for a software project to join? Look no further! Here are some of the projects that are currently looking for contributors.\n\nRemember that you should always be working on at least one project, and optionally more if you're interested! Each project channel will be forwarded updates and notifications relevant to the specific project.",
+        )
+        channel_members = members_by_display_name(
+            self.bot.software_projects_channel.members,
+        )
+        # Embeds are limited to 25 fields, so if there are more projects than
+        # that, they are listed compactly in the description instead
+        compact = len(self.software_projects_cache) > EMBED_MAX_FIELDS
+        project_lines = []
+        for project in self.software_projects_cache:
+            link = f"[/projects/{project.number}]({project.url})"
+            if compact:
+                project_lines.append(
+                    f"* **#{project.title}** ({link}): {len(project.unassigned_items)} unassigned tasks",
                 )
-            embed.set_footer(
-                text="If you are receiving this message accidentally, ensure that you are still assigned a task in Github and that your name on Discord and GitHub match.",
+                continue
+            lead_members = []
+            for name in project.leader_names:
+                member_named = channel_members.get(name.lower())
+                if member_named:
+                    lead_members.append(member_named.mention)
+                else:
+                    lead_members.append(name)
+            leads = " | ".join(lead_members)
+            embed.add_field(
+                name=f"#{project.title}",
+                value=f"**Leaders:** {leads}, **Link:** {link}\n{project.short_description}\n**{len(project.unassigned_items)} unassigned tasks**",
+                inline=False,
             )
-            view = MILBotView()
-            view.add_item(
-                discord.ui.Button(
-                    label="Go to #software-projects",
-                    url=self.bot.software_projects_channel.jump_url,
-                ),
+        if project_lines:
+            assert embed.description is not None
+            embed.description += "\n\n" + capped_str(
+                project_lines,
+                cap=EMBED_MAX_DESCRIPTION - len(embed.description) - 2,
             )
-            await member.send(embed=embed, view=view)
+        embed.set_footer(
+            text="If you are receiving this message accidentally, ensure that you are still assigned a task in Github and that your name on Discord and GitHub match.",
+        )
+        view = MILBotView()
+        view.add_item(
+            discord.ui.Button(
+                label="Go to #software-projects",
+                url=self.bot.software_projects_channel.jump_url,
+            ),
+        )
+        results = await asyncio.gather(
+            *(member.send(embed=embed, view=view) for member in unassigned_members),
+            return_exceptions=True,
+        )
+        for member, result in zip(unassigned_members, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Failed to send project reminder to {member}.",
+                    exc_info=result,
+                )
 
     @run_on_weekday([calendar.MONDAY, calendar.THURSDAY], 0, 0)
     async def whosonwhat(self):
@@ -144,14 +207,12 @@ class SoftwareProjects(commands.Cog):
         ]
         for member in members:
             assignments[member] = []
+        members_named = members_by_display_name(members)
         for project in self.software_projects_cache:
             for item in project.items:
                 if item.assignees and item.status != SoftwareProjectStatus.DONE:
                     for assignee in item.assignees:
-                        member = discord.utils.find(
-                            lambda m: m.display_name.lower() == assignee.name.lower(),
-                            members,
-                        )
+                        member = members_named.get(assignee.name.lower())
                         if member:
                             assignments[member].append(
                                 f"**#{project.title}** - {item.issue_number}",
@@ -178,9 +239,37 @@ class SoftwareProjects(commands.Cog):
 
         await self.bot.team_leads_ch(Team.SOFTWARE).send(embed=embed)
 
-    @tasks.loop(seconds=30)
+    @commands.Cog.listener()
+    async def on_github_projects_update(self):
+        # Project webhooks tend to come in bursts (ex, moving several items), so
+        # wait for them to settle, restarting the wait on every webhook
+        if self._pending_refresh and not self._pending_refresh.done():
+            self._pending_refresh.cancel()
+        self._pending_refresh = asyncio.create_task(self._refresh_after_delay())
+
+    async def _refresh_after_delay(self):
+        await asyncio.sleep(PROJECTS_WEBHOOK_REFRESH_DELAY)
+        # Only the wait above can be cancelled by a later webhook. The refresh
+        # runs as its own task so that it is never cancelled between creating a
+        # project's role and its channel.
+        self.bot.tasks.create_task(self.refresh_projects())
+
+    async def cog_unload(self):
+        if self._pending_refresh:
+            self._pending_refresh.cancel()
+
+    # Changes are normally picked up through project webhooks, so this only
+    # catches anything that was missed
+    @tasks.loop(minutes=5)
     async def update_projects(self):
         await self.bot.wait_until_ready()
+        await self.refresh_projects()
+
+    async def refresh_projects(self):
+        async with self._refresh_lock:
+            await self._refresh_projects()
+
+    async def _refresh_projects(self):
         embed = discord.Embed(
             title="Software Projects",
             color=discord.Color.teal(),
@@ -188,13 +277,13 @@ class SoftwareProjects(commands.Cog):
         )
         software_projects = await self.bot.github.get_software_projects()
         self.software_projects_cache = software_projects
+        channel_members = members_by_display_name(
+            self.bot.software_projects_channel.members,
+        )
         for project in self.software_projects_cache:
             lead_members = []
-            for name in project.leader_names():
-                member_named = discord.utils.find(
-                    lambda m: m.display_name.lower() == name.lower(),
-                    self.bot.software_projects_channel.members,
-                )
+            for name in project.leader_names:
+                member_named = channel_members.get(name.lower())
                 if member_named:
                     lead_members.append(member_named.mention)
                 else:
@@ -240,6 +329,10 @@ class SoftwareProjects(commands.Cog):
                     topic=project.short_description,
                     overwrites=overwrites,
                 )
+        # The listing rarely changes, so skip looking up the message (and building
+        # the view) when it is already up to date and has not been deleted
+        if embed == self._projects_embed:
+            return
         view = SoftwareProjectsView(self.bot, software_projects)
         oldest = [
             m
@@ -249,9 +342,33 @@ class SoftwareProjects(commands.Cog):
             )
         ]
         if len(oldest) < 1:
-            await self.bot.software_projects_channel.send(embed=embed, view=view)
-        elif oldest[0].embeds[0] != embed:
-            await oldest[0].edit(embed=embed, view=view)
+            message = await self.bot.software_projects_channel.send(
+                embed=embed,
+                view=view,
+            )
+        else:
+            message = oldest[0]
+            if message.embeds[0] != embed:
+                await message.edit(embed=embed, view=view)
+        self._projects_embed = embed
+        self._projects_message_id = message.id
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        # The listing is only skipped while its message exists, so that the next
+        # refresh posts it again
+        if payload.message_id == self._projects_message_id:
+            self._projects_embed = None
+            self._projects_message_id = None
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(
+        self,
+        payload: discord.RawBulkMessageDeleteEvent,
+    ):
+        if self._projects_message_id in payload.message_ids:
+            self._projects_embed = None
+            self._projects_message_id = None
 
 
 async def setup(bot: MILBot):
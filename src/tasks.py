@@ -23,6 +23,9 @@ from discord.utils import maybe_coroutine
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+# Longest single sleep while waiting for a scheduled task
+MAX_SLEEP_SECONDS = 3600
+
 
 def run_on_weekday(
     day: int | list[int] | list[Day],
@@ -102,7 +105,11 @@ class RecurringTask:
         # Wait
         next_time = self.next_time()
         logger.info(f"Scheduling {self._func.__name__} for {next_time}.")
-        await asyncio.sleep((next_time - datetime.datetime.now()).total_seconds())
+        # Sleep in bounded chunks, checking the wall clock in between, so that
+        # clock changes (ex, DST or NTP corrections) or the host being suspended
+        # can't make the task fire far too late
+        while (delay := (next_time - datetime.datetime.now()).total_seconds()) > 0:
+            await asyncio.sleep(min(delay, MAX_SLEEP_SECONDS))
 
         # Schedule the next instance
         self.schedule()
@@ -187,13 +194,11 @@ class WeeklyTask(RecurringTask):
     def next_time(self):
         now = datetime.datetime.now()
 
-        # If multiple days, choose the next day
+        # If multiple days, choose the next day. Every candidate is computed from
+        # the same starting point, so the result can't change mid-comparison
         if isinstance(self._day, list):
-            actual_day = min(self._day, key=lambda d: self._dt_from_weekday(d) - now)
-        else:
-            actual_day = self._day
-
-        return self._dt_from_weekday(actual_day)
+            return min(self._dt_from_weekday(day, now) for day in self._day)
+        return self._dt_from_weekday(self._day, now)
 
     def __str__(self) -> str:
         return f"WeeklyTask({self._func.__name__}, {self._day}, {self._hour}, {self._minute}, {self._shift}, {self._check})"
@@ -126,20 +126,23 @@ class TimeTransformer(app_commands.Transformer):
         raise ValueError("Invalid time format. Please enter a valid time.")
 
 
-def capped_str(parts: list[str], cap: int = 1024) -> str:
+def capped_str(parts: list[str], cap: int = 1024, separator: str = "\n") -> str:
     """
-    Joins the most parts possible with a new line between them. If the resulting
-    length is greater than the cap length, then the remaining parts are truncated.
+    Joins the most parts possible with the separator (by default, a new line)
+    between them. If the resulting length is greater than the cap length, then
+    the remaining parts are truncated.
 
     If the parts are capped, "_... (X after)_" is appended to the end.
     """
-    result = ""
+    result = []
+    length = 0
     for made_it, part in enumerate(parts):
-        if len(result) + len(part) + len("\n_... (99 after)_") > cap:
-            result += f"_... ({len(parts) - made_it} after)_"
+        if length + len(part) + len(separator) + len("_... (99 after)_") > cap:
+            result.append(f"_... ({len(parts) - made_it} after)_")
             break
-        result += part + "\n"
-    return result.strip()
+        result.append(part)
+        length += len(part) + len(separator)
+    return separator.join(result).strip()
 
 
 # derived from: https://stackoverflow.com/a/20007730
@@ -36,6 +36,9 @@ class WebhookResponse:
     # so that we can compare it to the new date and send a message
     _project_v2_item_change_dates: ClassVar[dict[str, datetime.datetime | None]] = {}
 
+    # Whether receiving this webhook should refresh the #software-projects listing
+    updates_projects: ClassVar[bool] = False
+
     SECURE_TEAM_NAMES: ClassVar[list[str]] = [
         "lead",
         "autopushers",
@@ -755,6 +758,7 @@ class LabelDeleted(WebhookResponse):
 
 @dataclass
 class ProjectsV2ItemCreated(WebhookResponse):
+    updates_projects: ClassVar[bool] = True
     pvt_done: bool = False
 
     async def pvt(self) -> None:
@@ -802,6 +806,7 @@ class ProjectsV2ItemCreated(WebhookResponse):
 
 @dataclass
 class ProjectsV2ItemEdited(WebhookResponse):
+    updates_projects: ClassVar[bool] = True
     delay_sec: int = 30
 
     def __post_init__(self):
@@ -898,6 +903,7 @@ class ProjectsV2ItemEdited(WebhookResponse):
 
 @dataclass
 class ProjectsV2ItemDeleted(WebhookResponse):
+    updates_projects: ClassVar[bool] = True
     delay_sec: int = 30
     pvt_set: bool = False
 
@@ -980,6 +986,7 @@ class ProjectsV2ItemDeleted(WebhookResponse):
 
 @dataclass
 class ProjectsV2Created(WebhookResponse):
+    updates_projects: ClassVar[bool] = True
     # All projects_v2_created webhooks have the project title listed as
     # @user's untitled project, so we should wait a little bit of time
     # and then fetch the title later
@@ -1004,6 +1011,8 @@ class ProjectsV2Created(WebhookResponse):
 
 @dataclass
 class ProjectsV2Deleted(WebhookResponse):
+    updates_projects: ClassVar[bool] = True
+
     def targets(self) -> list[discord.TextChannel]:
         return [self.updates_channel(self.github_data["organization"]["login"])]
 
@@ -1040,6 +1049,9 @@ class Webhooks(commands.Cog):
         # main class, we don't need it for anything
         async def response(_: Any, payload: ClientPayload):
             wh = response_type(payload.github_data, self.bot)
+            # Project changes also need the #software-projects listing refreshed
+            if response_type.updates_projects:
+                self.bot.dispatch("github_projects_update")
 
             async def _post_coro():
                 if await wh.ignore():